@@ -1,27 +1,26 @@
 # ad_checker.py
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import copy
+import functools
+import importlib.util
 import json
 import io
 import csv
 import re
-from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Iterator, List, Dict, Tuple, Optional
+from xml.sax.saxutils import escape as xml_escape
 
-# --- PDF (ReportLab) imports ---
-try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import mm
-    from reportlab.platypus import (
-        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak
-    )
-    from reportlab.lib import colors
-    REPORTLAB_AVAILABLE = True
-except Exception:
-    REPORTLAB_AVAILABLE = False
+# --- PDF (ReportLab): only located here; imported by the PDF builders on first use ---
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
 
 # --- Batch/Merge imports ---
 try:
@@ -36,6 +35,41 @@ try:
 except Exception:
     PANDAS_AVAILABLE = False
 
+# --- HTML parser backend (C-backed lxml when installed) ---
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except Exception:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except Exception:
+    SELECTOLAX_AVAILABLE = False
+
+# --- On-disk HTTP cache ---
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except Exception:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# --- Fast JSON decoding ---
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
+# --- Linear-time regex engine (google-re2) ---
+try:
+    import re2
+    RE2_AVAILABLE = True
+except Exception:
+    RE2_AVAILABLE = False
+
 
 # -----------------------------
 # Page setup + Branding (UI)
@@ -75,13 +109,45 @@ _ALWAYS_WATERMARK_TEXT = "DEMO"
 # -----------------------------
 EFFECTIVE_SENTENCE_RE = re.compile(
     r"(?:This\s*)?AD(?:\s+\d{4}-\d{2}-\d{2})?\s*(?:\([^)]*\))?\s*(?:is|becomes)\s*effective(?:\s+on)?\s*\(?\s*([A-Za-z]+ \d{1,2}, \d{4})\s*\)?",
-    re.IGNORECASE | re.DOTALL
+    re.IGNORECASE
 )
 MONTH_DATE_RE = re.compile(r"\b([A-Za-z]+ \d{1,2}, \d{4})\b")
+# RE2 copy of the sentence pattern for ASCII text: it never backtracks over the long runs between
+# "AD" and "effective". RE2's \s lacks \v and \x1c-\x1f, so Python's ASCII \s is spelled out.
+EFFECTIVE_SENTENCE_RE2 = (
+    re2.compile("(?i)" + EFFECTIVE_SENTENCE_RE.pattern.replace(r"\s", r"[\t\n\x0b\x0c\r\x1c-\x1f ]"))
+    if RE2_AVAILABLE else None
+)
 
+_MONTH_NUMBERS = {
+    name: i for i, name in enumerate(
+        ("january", "february", "march", "april", "may", "june", "july",
+         "august", "september", "october", "november", "december"), start=1)
+}
+
+def _parse_month_date(date_str: str) -> date:
+    """datetime.strptime(date_str.strip(), "%B %d, %Y").date(), hand-parsed for the usual "March 3, 2024" shape."""
+    parts = date_str.split()
+    if len(parts) == 3 and parts[1].endswith(",") and date_str.isascii():
+        month = _MONTH_NUMBERS.get(parts[0].lower())
+        day, year = parts[1][:-1], parts[2]
+        if month and 1 <= len(day) <= 2 and day.isdigit() and len(year) == 4 and year.isdigit():
+            return date(int(year), month, int(day))  # ValueError for impossible dates, like strptime
+    return datetime.strptime(date_str.strip(), "%B %d, %Y").date()
+
+def _parse_iso_date(date_str: str) -> date:
+    """datetime.strptime(date_str, "%Y-%m-%d").date(), hand-parsed for zero-padded YYYY-MM-DD."""
+    if (len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-" and date_str.isascii()
+            and (date_str[:4] + date_str[5:7] + date_str[8:]).isdigit()):
+        return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+# Pure str -> str helpers over a handful of distinct dates; memoised so repeated
+# lookups (both date fields, batch rows for the same AD) skip the parsing
+@functools.lru_cache(maxsize=256)
 def _normalize_date(date_str: str) -> Optional[str]:
     try:
-        return datetime.strptime(date_str.strip(), "%B %d, %Y").date().isoformat()
+        return _parse_month_date(date_str).isoformat()
     except Exception:
         return None
 
@@ -89,32 +155,35 @@ def extract_effective_date_from_text(text: str) -> Optional[str]:
     if not text:
         return None
     t = text.replace("\u00a0", " ")
-    m = EFFECTIVE_SENTENCE_RE.search(t)
+    # Both lookups below need the word "effective"; skip the sentence regex when it's absent
+    eff_idx = t.lower().find("effective")
+    if eff_idx == -1:
+        return None
+    # Only on ASCII text do re and RE2 agree on \d and case folding
+    sentence_re = EFFECTIVE_SENTENCE_RE2 if EFFECTIVE_SENTENCE_RE2 is not None and t.isascii() else EFFECTIVE_SENTENCE_RE
+    m = sentence_re.search(t)
     if m:
         norm = _normalize_date(m.group(1))
         if norm:
             return norm
-    eff_idx = t.lower().find("effective")
-    if eff_idx != -1:
-        window = t[eff_idx:eff_idx + 240]
-        m2 = MONTH_DATE_RE.search(window)
-        if m2:
-            norm = _normalize_date(m2.group(1))
-            if norm:
-                return norm
+    window = t[eff_idx:eff_idx + 240]
+    m2 = MONTH_DATE_RE.search(window)
+    if m2:
+        norm = _normalize_date(m2.group(1))
+        if norm:
+            return norm
     return None
 
+@functools.lru_cache(maxsize=256)
 def to_ddmmyyyy(date_str: Optional[str]) -> Optional[str]:
     if not date_str:
         return None
     try:
-        dt = datetime.strptime(date_str[:10], "%Y-%m-%d")
-        return dt.strftime("%d-%m-%Y")
+        return _parse_iso_date(date_str[:10]).strftime("%d-%m-%Y")
     except Exception:
         pass
     try:
-        dt = datetime.strptime(date_str.strip(), "%B %d, %Y")
-        return dt.strftime("%d-%m-%Y")
+        return _parse_month_date(date_str).strftime("%d-%m-%Y")
     except Exception:
         return date_str
 
@@ -122,58 +191,96 @@ def to_ddmmyyyy(date_str: Optional[str]) -> Optional[str]:
 # -----------------------------
 # Robust text slicers for (letter) sections
 # -----------------------------
-LETTER_BLOCK_RE_TEMPLATE = r"""
-    \(\s*{letter}\s*\)       # (c), (d), (g), (h)...
-    [^\n]*?                  # header line
-    \n?                      # optional newline
-    (                        # capture the body
-        .*?
-    )
-    (?=                      # stop at next lettered section or end
-        \n\(\s*[a-z]\s*\)\s*[^\n]*\n
-        | \Z
-    )
-"""
+# A block runs from its "(x)" marker (plus one optional newline) up to the
+# next line that starts with another "(y)" marker, or the end of the text.
+LETTER_MARKER_RE = re.compile(r"\(\s*([a-z])\s*\)", re.IGNORECASE)
+LETTER_BOUNDARY_RE = re.compile(r"\n\(\s*[a-z]\s*\)\s*[^\n]*\n", re.IGNORECASE)
+# Markers not already at a line start get pushed onto their own line
+LETTER_HEADER_NORM_RE = re.compile(r"(?<!\n)\(\s*([a-z])\s*\)", re.IGNORECASE)
+
+def _normalize_letter_text(full_text: str) -> str:
+    t = full_text.replace("\u00a0", " ")
+    t = t.replace("\r\n", "\n").replace("\r", "\n")
+    t = LETTER_HEADER_NORM_RE.sub(r"\n(\1)", t)
+    return t
 
-def slice_letter_block(full_text: str, letter: str) -> Optional[str]:
+def slice_letter_blocks(full_text: str, letters: str) -> Dict[str, Optional[str]]:
+    """Slice several (letter) sections with one normalization pass and one marker scan."""
+    blocks: Dict[str, Optional[str]] = {letter: None for letter in letters}
     if not full_text:
-        return None
-    t = full_text.replace("\u00a0", " ")
-    t = re.sub(r"\r\n?", "\n", t)
-    t = re.sub(r"(?<!\n)\(\s*([a-z])\s*\)", r"\n(\1)", t, flags=re.IGNORECASE)
-    pat = LETTER_BLOCK_RE_TEMPLATE.format(letter=re.escape(letter))
-    block_re = re.compile(pat, re.IGNORECASE | re.DOTALL | re.VERBOSE)
-    m = block_re.search(t)
-    if m:
-        body = m.group(1).strip()
-        body = re.sub(r"\n{3,}", "\n\n", body)
-        return body if body else None
-    return None
+        return blocks
+    t = _normalize_letter_text(full_text)
+
+    # Index the first marker of every letter in a single scan
+    starts: Dict[str, int] = {}
+    for m in LETTER_MARKER_RE.finditer(t):
+        starts.setdefault(m.group(1).lower(), m.end())
+
+    for letter in letters:
+        start = starts.get(letter.lower())
+        if start is None:
+            continue
+        if t.startswith("\n", start):
+            start += 1
+        nxt = LETTER_BOUNDARY_RE.search(t, start)
+        body = t[start:nxt.start() if nxt else len(t)].strip()
+        while "\n\n\n" in body:
+            body = body.replace("\n\n\n", "\n\n")
+        blocks[letter] = body if body else None
+    return blocks
+
+def slice_letter_block(full_text: str, letter: str) -> Optional[str]:
+    return slice_letter_blocks(full_text, letter)[letter]
 
 # SB code pattern & helpers
 SB_CODE_RE = re.compile(r"\b[A-Z0-9]+(?:-[A-Z0-9]+)*-SB[0-9A-Z]+(?:-[0-9A-Z]+)*\b", re.IGNORECASE)
+# Characters an SB code (plus the word characters around it) can be made of, on ASCII text
+_SB_RUN_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-")
+
+def _sb_code_matches(text: str) -> Iterator[re.Match]:
+    """
+    SB_CODE_RE.finditer(text), but the regex only runs over the run of code characters
+    around each "-SB" hit found by str.find, rather than trying every position of the text.
+    """
+    if not text.isascii():
+        # lower() / IGNORECASE only line up index-for-index on ASCII
+        yield from SB_CODE_RE.finditer(text)
+        return
+    tl = text.lower()
+    n = len(text)
+    pos = 0  # where finditer would resume: the end of the previous match
+    j = tl.find("-sb")
+    while j != -1:
+        # Every match is a substring of one run, so the run bounds the search
+        start = j
+        while start > pos and text[start - 1] in _SB_RUN_CHARS:
+            start -= 1
+        end = j + 3
+        while end < n and text[end] in _SB_RUN_CHARS:
+            end += 1
+        m = SB_CODE_RE.search(text, start, end)
+        if m:
+            yield m
+            pos = m.end()
+            j = tl.find("-sb", pos)
+        else:
+            j = tl.find("-sb", end)
+
 def find_sb_refs(text: str) -> List[str]:
     if not text:
         return []
-    refs = [m.group(0).upper() for m in SB_CODE_RE.finditer(text)]
-    out, seen = [], set()
-    for r in refs:
-        if r not in seen:
-            seen.add(r)
-            out.append(r)
-    return out
+    # dict keeps first-seen order, so this de-duplicates in one pass
+    return list(dict.fromkeys(m.group(0).upper() for m in _sb_code_matches(text)))
 
+SB_ATA_RE = re.compile(r"-SB(\d{2})", re.IGNORECASE)
 def ata_from_sb_code(sb_code: str) -> Optional[str]:
     """
     Extract the two digits immediately after 'SB' in an SB code, e.g.:
     '...-SB420045-00' -> '42'
     """
-    m = re.search(r"-SB(\d{2})", sb_code, flags=re.IGNORECASE)
+    m = SB_ATA_RE.search(sb_code)
     if m:
         return m.group(1)
-    m2 = re.search(r"-SB(\d{2})\d+", sb_code, flags=re.IGNORECASE)
-    if m2:
-        return m2.group(1)
     return None
 
 
@@ -197,18 +304,21 @@ ATA_DIRECT_RE = re.compile(
     r"\b(?:ATA|ATA\s*chapter|chapter\s*(?:ATA)?)\s*[-:]?\s*(\d{2})(?:[.\- ]?(\d{2}))?\b",
     re.IGNORECASE
 )
+# (pattern, ATA chapter, literals a match must start with) in priority order. A leading \b
+# stops re from using its fast literal scan, so each search starts at the first literal hit.
 ATA_KEYWORD_HINTS = [
-    (r"\bflight controls?\b", "27"),
-    (r"\bfuel\b", "28"),
-    (r"\bdoors?\b", "52"),
-    (r"\bfuselage\b", "53"),
-    (r"\bwings?\b", "57"),
-    (r"\bnavigation\b", "34"),
-    (r"\belectrical power\b", "24"),
-    (r"\bequipment|furnishings\b", "25"),
-    (r"\blanding gear\b", "32"),
-    (r"\bair conditioning\b", "21"),
+    (r"\bflight controls?\b", "27", ("flight control",)),
+    (r"\bfuel\b", "28", ("fuel",)),
+    (r"\bdoors?\b", "52", ("door",)),
+    (r"\bfuselage\b", "53", ("fuselage",)),
+    (r"\bwings?\b", "57", ("wing",)),
+    (r"\bnavigation\b", "34", ("navigation",)),
+    (r"\belectrical power\b", "24", ("electrical power",)),
+    (r"\bequipment|furnishings\b", "25", ("equipment", "furnishings")),
+    (r"\blanding gear\b", "32", ("landing gear",)),
+    (r"\bair conditioning\b", "21", ("air conditioning",)),
 ]
+ATA_KEYWORD_RES = [(re.compile(pat), code, literals) for pat, code, literals in ATA_KEYWORD_HINTS]
 def detect_ata_fallback(full_text: Optional[str], sb_refs: Optional[List[str]] = None) -> Optional[str]:
     # 1) Prefer SB-based ATA: first two digits after 'SB'
     if sb_refs:
@@ -219,15 +329,18 @@ def detect_ata_fallback(full_text: Optional[str], sb_refs: Optional[List[str]] =
     # 2) Direct mentions like "ATA 25"
     if full_text:
         t = full_text.replace("\u00a0", " ")
-        cands = [m.group(1) if not m.group(2) else f"{m.group(1)}-{m.group(2)}"
-                 for m in ATA_DIRECT_RE.finditer(t)]
-        if cands:
-            from collections import Counter
-            return Counter(cands).most_common(1)[0][0]
-        # 3) Keyword hints
         tl = t.lower()
-        for pat, code in ATA_KEYWORD_HINTS:
-            if re.search(pat, tl):
+        # Every ATA_DIRECT_RE match contains "ata" or "chapter"; most texts have neither
+        if "ata" in tl or "chapter" in tl:
+            cands = [m.group(1) if not m.group(2) else f"{m.group(1)}-{m.group(2)}"
+                     for m in ATA_DIRECT_RE.finditer(t)]
+            if cands:
+                # most frequent mention; ties go to the first one seen (as Counter.most_common did)
+                return max(dict.fromkeys(cands), key=cands.count)
+        # 3) Keyword hints
+        for hint_re, code, literals in ATA_KEYWORD_RES:
+            hits = [i for i in (tl.find(lit) for lit in literals) if i != -1]
+            if hits and hint_re.search(tl, min(hits)):
                 return code
     return None
 
@@ -235,6 +348,17 @@ def detect_ata_fallback(full_text: Optional[str], sb_refs: Optional[List[str]] =
 # -----------------------------
 # Targeted summarizer for (g) and (h)
 # -----------------------------
+SB_ISSUE_RE = re.compile(r"\bIssue\s+([0-9A-Za-z]+)\b", re.IGNORECASE)
+SB_DATED_RE = re.compile(r"\bdated\s+([A-Za-z]+\s+\d{1,2},\s*\d{4})\b", re.IGNORECASE)
+RC_LABEL_RE = re.compile(r"\bRC\b")
+SB_PARA5_COMPLIANCE_RE = re.compile(r"\bparagraph\s*5\b.*\bCompliance\b", re.IGNORECASE)
+PARA_H_RE = re.compile(r"\bparagraph\s*\(?h\)?\b", re.IGNORECASE)
+EXCEPT_AS_SPECIFIED_RE = re.compile(r"\bexcept as specified\b", re.IGNORECASE)
+ISSUE_DATE_RE = re.compile(r"\bIssue\b.*\bdate\b", re.IGNORECASE)
+EFFECTIVE_DATE_PHRASE_RE = re.compile(r"\beffective date\b", re.IGNORECASE)
+SERVICE_BULLETIN_RE = re.compile(r"\bservice bulletin\b", re.IGNORECASE)
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
 def summarize_g_h_sections(req_text: Optional[str], exc_text: Optional[str]) -> Tuple[List[str], List[str]]:
     bullets_g, bullets_h = [], []
 
@@ -245,10 +369,10 @@ def summarize_g_h_sections(req_text: Optional[str], exc_text: Optional[str]) ->
         sb_ref = sb_refs[0] if sb_refs else "the referenced Service Bulletin"
         issue = None
         issue_date = None
-        m_issue = re.search(r"\bIssue\s+([0-9A-Za-z]+)\b", t, flags=re.IGNORECASE)
+        m_issue = SB_ISSUE_RE.search(t)
         if m_issue:
             issue = m_issue.group(1)
-        m_date = re.search(r"\bdated\s+([A-Za-z]+\s+\d{1,2},\s*\d{4})\b", t, flags=re.IGNORECASE)
+        m_date = SB_DATED_RE.search(t)
         if m_date:
             issue_date = m_date.group(1)
 
@@ -260,10 +384,9 @@ def summarize_g_h_sections(req_text: Optional[str], exc_text: Optional[str]) ->
         elif issue_date:
             sb_phrase = f"{sb_ref}, dated {issue_date}"
 
-        has_rc = bool(re.search(r"\bRC\b", t))
-        mentions_compliance_para_5 = bool(re.search(r"\bparagraph\s*5\b.*\bCompliance\b", t, flags=re.IGNORECASE))
-        mentions_h_exception = bool(re.search(r"\bparagraph\s*\(?h\)?\b", t, flags=re.IGNORECASE)) or \
-                               bool(re.search(r"\bexcept as specified\b", t, flags=re.IGNORECASE))
+        has_rc = bool(RC_LABEL_RE.search(t))
+        mentions_compliance_para_5 = bool(SB_PARA5_COMPLIANCE_RE.search(t))
+        mentions_h_exception = bool(PARA_H_RE.search(t)) or bool(EXCEPT_AS_SPECIFIED_RE.search(t))
 
         if has_rc:
             bullets_g.append(
@@ -287,12 +410,12 @@ def summarize_g_h_sections(req_text: Optional[str], exc_text: Optional[str]) ->
     # --------- (h) Exceptions ----------
     if exc_text and exc_text.strip().upper() != "N/A":
         t = exc_text.strip()
-        m_issue_mention = re.search(r"\bIssue\s+([0-9A-Za-z]+)\b", t, flags=re.IGNORECASE)
+        m_issue_mention = SB_ISSUE_RE.search(t)
         issue_in_h = m_issue_mention.group(1) if m_issue_mention else None
 
-        refers_issue_date = bool(re.search(r"\bIssue\b.*\bdate\b", t, flags=re.IGNORECASE))
-        mentions_effective_date = bool(re.search(r"\beffective date\b", t, flags=re.IGNORECASE))
-        mentions_sb_phrase = bool(re.search(r"\bservice bulletin\b", t, flags=re.IGNORECASE))
+        refers_issue_date = bool(ISSUE_DATE_RE.search(t))
+        mentions_effective_date = bool(EFFECTIVE_DATE_PHRASE_RE.search(t))
+        mentions_sb_phrase = bool(SERVICE_BULLETIN_RE.search(t))
 
         if refers_issue_date and mentions_effective_date and mentions_sb_phrase:
             if issue_in_h:
@@ -305,7 +428,7 @@ def summarize_g_h_sections(req_text: Optional[str], exc_text: Optional[str]) ->
                 )
             bullets_h.append("All other Service Bulletin instructions remain unchanged.")
         else:
-            sentences = re.split(r'(?<=[.!?])\s+', t)
+            sentences = SENTENCE_SPLIT_RE.split(t)
             for s in sentences:
                 s = s.strip()
                 if not s:
@@ -317,21 +440,155 @@ def summarize_g_h_sections(req_text: Optional[str], exc_text: Optional[str]) ->
     return bullets_g, bullets_h
 
 
+# -----------------------------
+# HTTP session (shared connection pool)
+# -----------------------------
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    """One keep-alive Session for all fetches; cached so Streamlit reruns reuse its pool."""
+    if REQUESTS_CACHE_AVAILABLE:
+        # Only Federal Register responses go to disk: published AD documents and bodies rarely
+        # change, so they are kept for a day and revalidated with ETag/Last-Modified. The search
+        # can gain new results, so it gets 1 h. That sits under _fetch_ad_data's own 1 h
+        # st.cache_data TTL, so after a restart or a cache clear a search can be up to ~2 h old.
+        # Anything else (logo, user-supplied stamp URLs) is fetched live and never stored.
+        session = requests_cache.CachedSession(
+            cache_name=".ad_http_cache",
+            backend="sqlite",
+            expire_after=86400,
+            urls_expire_after={
+                "*/api/v1/documents.json": 3600,
+                "*.federalregister.gov": 86400,
+                "*": requests_cache.DO_NOT_CACHE,
+            },
+            allowable_codes=(200,),
+            cache_control=True,
+        )
+    else:
+        session = requests.Session()
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+SESSION = _http_session()
+
+def response_json(response: requests.Response):
+    """Decode a JSON response body, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            # keep response.json()'s contract: a RequestException subclass
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+    return response.json()
+
+
+# -----------------------------
+# HTML -> text
+# -----------------------------
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+_NON_TEXT_TAG_LIST = sorted(_NON_TEXT_TAGS)  # selectolax's strip_tags() wants a list
+
+def _lxml_tree_text(root, separator: str) -> str:
+    parts = []
+    walker = etree.iterwalk(root, events=("start", "end", "comment", "pi"))
+    for event, el in walker:
+        if event == "start":
+            if el.tag in _NON_TEXT_TAGS:
+                # libxml2 parses <template> content as ordinary children; drop the whole subtree
+                walker.skip_subtree()
+            elif el.text:
+                parts.append(el.text)
+        elif el is not root and el.tail:
+            parts.append(el.tail)
+    return separator.join(p for p in (s.strip() for s in parts) if p)
+
+def _selectolax_text(markup, separator: str) -> str:
+    tree = LexborHTMLParser(markup)
+    tree.strip_tags(_NON_TEXT_TAG_LIST)
+    if tree.root is None:
+        return ""
+    # NUL never survives HTML parsing, so it marks text-node boundaries; empty nodes are dropped
+    return separator.join(p for p in tree.root.text(separator="\x00", strip=True).split("\x00") if p)
+
+def html_to_text(markup, separator: str = "\n") -> str:
+    """
+    Flatten HTML (bytes are decoded as UTF-8) to its stripped text strings joined by
+    `separator` — same output as BeautifulSoup's get_text(separator, strip=True), but
+    parsed in C by selectolax (lexbor) or lxml when either is installed.
+    """
+    if not markup or not markup.strip():
+        return ""
+    if SELECTOLAX_AVAILABLE:
+        return _selectolax_text(markup, separator)
+    if not LXML_AVAILABLE:
+        from bs4 import BeautifulSoup  # last-resort parser; only imported when needed
+        extra = {"from_encoding": "utf-8"} if isinstance(markup, bytes) else {}
+        return BeautifulSoup(markup, "html.parser", **extra).get_text(separator, strip=True)
+
+    try:
+        if isinstance(markup, bytes):
+            root = lxml.html.document_fromstring(markup, parser=lxml.html.HTMLParser(encoding="utf-8"))
+        else:
+            root = lxml.html.fromstring(markup)
+    except etree.ParserError:  # "Document is empty", e.g. markup that is only a comment
+        return ""
+    return _lxml_tree_text(root, separator)
+
+def fetch_html_text(url: str, timeout: float = 12) -> str:
+    """GET an HTML page and return html_to_text() of it. The body is read whole and parsed from
+    bytes (no str decode); only the lxml-only fallback parses chunks as they arrive."""
+    with SESSION.get(url, timeout=timeout, stream=True) as r:
+        r.raise_for_status()
+        if SELECTOLAX_AVAILABLE or not LXML_AVAILABLE:
+            return html_to_text(r.content)
+        # No-selectolax fallback: feed lxml's incremental parser chunk by chunk. With the
+        # on-disk CachedSession the body has already been read in full to store it, so this
+        # only saves the one-shot bytes buffer on a plain requests.Session.
+        parser = lxml.html.HTMLParser(encoding="utf-8")
+        fed = False
+        for chunk in r.iter_content(chunk_size=16384):
+            if chunk:
+                parser.feed(chunk)
+                fed = True
+        if not fed:
+            return ""
+        root = parser.close()
+    if root is None:  # only whitespace/comments arrived
+        return ""
+    return _lxml_tree_text(root, "\n")
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _fetch_text(url: str) -> str:
+    """fetch_html_text() memoised per URL across reruns; raises on errors so failures are not cached."""
+    return fetch_html_text(url)
+
+
 # -----------------------------
 # Data fetchers
 # -----------------------------
-def fetch_ad_data(ad_number: str):
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_ad_data(ad_number: str) -> Optional[Dict]:
+    """Cached Federal Register search; raises on request errors so failures are not cached."""
     base_url = "https://www.federalregister.gov/api/v1/documents.json"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    try:
-        response = requests.get(
-            base_url,
-            params={"conditions[term]": f"Airworthiness Directive {ad_number}", "per_page": 25},
-            headers=headers,
-            timeout=12
-        )
+    params = {
+        "conditions[term]": f"Airworthiness Directive {ad_number}",
+        "conditions[agencies][]": "federal-aviation-administration",
+        # only the columns read below, instead of every default field per hit
+        "fields[]": ["title", "effective_on", "html_url", "pdf_url", "document_number", "publication_date",
+                     "body_html_url"],
+    }
+    # The match is almost always in the first few hits; only widen the page if it wasn't.
+    for per_page in (5, 25):
+        response = SESSION.get(base_url, params={**params, "per_page": per_page}, timeout=12)
         response.raise_for_status()
-        results = response.json().get("results", [])
+        results = response_json(response).get("results", [])
         for doc in results:
             title = (doc.get("title") or "")
             if ad_number in title or "airworthiness directive" in title.lower():
@@ -342,20 +599,35 @@ def fetch_ad_data(ad_number: str):
                     "pdf_url": doc.get("pdf_url"),
                     "document_number": doc.get("document_number"),
                     "publication_date": doc.get("publication_date"),
+                    "body_html_url": doc.get("body_html_url"),
                 }
+        if len(results) < per_page:
+            break
+    return None
+
+def fetch_ad_data(ad_number: str):
+    try:
+        return _fetch_ad_data(ad_number)
     except requests.RequestException as e:
         st.error(f"❌ Request failed: {e}")
     return None
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_document_json(document_number: str) -> Dict:
+    """Cached per-document API fetch; raises on errors so failures are not cached."""
+    url = f"https://www.federalregister.gov/api/v1/documents/{document_number}.json"
+    # Only what the extractors read; the full record (CFR refs, agencies, regs.gov info, ...)
+    # is several times larger and is also hashed by st.cache_data as an argument downstream.
+    fields = ["title", "abstract", "excerpts", "dates", "body_html_url"]
+    r = SESSION.get(url, params={"fields[]": fields}, timeout=12)
+    r.raise_for_status()
+    return response_json(r)
+
 def fetch_document_json(document_number: str) -> Optional[Dict]:
     if not document_number:
         return None
-    url = f"https://www.federalregister.gov/api/v1/documents/{document_number}.json"
-    headers = {"User-Agent": "Mozilla/5.0"}
     try:
-        r = requests.get(url, headers=headers, timeout=12)
-        r.raise_for_status()
-        return r.json()
+        return _fetch_document_json(document_number)
     except Exception:
         return None
 
@@ -372,9 +644,7 @@ def extract_effective_from_api_document(doc_json: Optional[Dict], html_fallback_
     body_html_url = doc_json.get("body_html_url")
     if body_html_url:
         try:
-            r = requests.get(body_html_url, timeout=12)
-            r.raise_for_status()
-            text = BeautifulSoup(r.text, "html.parser").get_text("\n", strip=True)
+            text = _fetch_text(body_html_url)  # usually already cached by _extract_details
             found = extract_effective_date_from_text(text)
             if found:
                 return found
@@ -390,7 +660,8 @@ def extract_effective_from_api_document(doc_json: Optional[Dict], html_fallback_
             candidates.extend([x for x in val if isinstance(x, str)])
 
     for c in candidates:
-        text = BeautifulSoup(c, "html.parser").get_text(" ", strip=True)
+        # abstracts/excerpts are usually plain text; only parse the ones carrying markup
+        text = html_to_text(c, " ") if ("<" in c or "&" in c) else c.strip()
         found = extract_effective_date_from_text(text)
         if found:
             return found
@@ -404,43 +675,76 @@ def extract_effective_from_api_document(doc_json: Optional[Dict], html_fallback_
 # -----------------------------
 # Section details extractor
 # -----------------------------
-def extract_details(ad_html_url: str, api_doc: Optional[Dict]):
-    headers = {"User-Agent": "Mozilla/5.0"}
+# "(x) ... Compliance ..." header line, body up to the next lettered header
+COMPLIANCE_SECTION_RE = re.compile(
+    r"\(\s*[a-z]\s*\)\s*[^\n]*\bCompliance\b[^\n]*\n(.*?)(?=\n\(\s*[a-z]\s*\)\s*[^\n]*\n|\Z)",
+    re.IGNORECASE | re.DOTALL
+)
+COMPLIANCE_FALLBACK_RE = re.compile(r"\bCompliance\b[:.]?\s*(.+?)(?=\n{2,}|\Z)", re.IGNORECASE | re.DOTALL)
+COMPLIANCE_HEADER_RE = re.compile(r"\(\s*[a-z]\s*\)\s*[^\n]*\bCompliance\b[^\n]*\n", re.IGNORECASE)
+COMPLIANCE_WORD_RE = re.compile(r"\bCompliance\b", re.IGNORECASE)
+
+def _compliance_words(full_text: str) -> Iterator[re.Match]:
+    """COMPLIANCE_WORD_RE.finditer(full_text), with candidates located by str.find on ASCII text."""
+    if not full_text.isascii():
+        # lower() / IGNORECASE only line up index-for-index on ASCII
+        yield from COMPLIANCE_WORD_RE.finditer(full_text)
+        return
+    tl = full_text.lower()
+    i = tl.find("compliance")
+    while i != -1:
+        m = COMPLIANCE_WORD_RE.match(full_text, i)  # \b still sees the text before i
+        if m:
+            yield m
+            i = tl.find("compliance", m.end())
+        else:
+            i = tl.find("compliance", i + 1)
+
+def find_compliance_section(full_text: str) -> Optional[re.Match]:
+    """
+    Same result as COMPLIANCE_SECTION_RE.search(full_text), but the header is only tried on
+    lines that mention "Compliance" instead of from every inline "(a)"-style reference.
+    """
+    last_line = -1
+    for word in _compliance_words(full_text):
+        line_start = full_text.rfind("\n", 0, word.start()) + 1
+        if line_start == last_line:
+            continue
+        last_line = line_start
+        line_end = full_text.find("\n", word.end())
+        if line_end == -1:
+            break  # the header needs a trailing newline
+        # A header's "(x)" marker may sit on an earlier line if only whitespace follows it
+        k = line_start
+        while k > 0 and full_text[k - 1].isspace():
+            k -= 1
+        window_start = full_text.rfind("(", 0, k)
+        header = COMPLIANCE_HEADER_RE.search(full_text, window_start if window_start != -1 else line_start, line_end + 1)
+        if header:
+            return COMPLIANCE_SECTION_RE.match(full_text, header.start())
+    return None
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _extract_details(ad_html_url: str, api_doc: Optional[Dict]) -> Dict:
+    """Cached section extraction; raises if no page could be fetched so failures are not cached."""
     full_text = ""
 
     # 1) Try body_html_url first
     if api_doc and api_doc.get("body_html_url"):
         try:
-            r = requests.get(api_doc["body_html_url"], headers=headers, timeout=12)
-            r.raise_for_status()
-            body_soup = BeautifulSoup(r.text, "html.parser")
-            full_text = body_soup.get_text("\n", strip=True)
+            full_text = _fetch_text(api_doc["body_html_url"])
         except Exception:
-            body_soup = None
-    else:
-        body_soup = None
+            pass
 
     # 2) Fallback: public HTML page
     if not full_text:
-        try:
-            r = requests.get(ad_html_url, headers=headers, timeout=12)
-            r.raise_for_status()
-            page_soup = BeautifulSoup(r.text, "html.parser")
-            full_text = page_soup.get_text("\n", strip=True)
-        except Exception as e:
-            return {
-                "affected_aircraft": f"Error extracting: {e}",
-                "required_actions": "N/A",
-                "exceptions": "N/A",
-                "compliance_times": "N/A",
-                "sb_references": [],
-                "_full_html_text": "",
-            }
+        full_text = _fetch_text(ad_html_url)
 
     # Slice key letter blocks
-    applic_text = slice_letter_block(full_text, "c")
-    req_actions_text = slice_letter_block(full_text, "g")
-    exceptions_text = slice_letter_block(full_text, "h")
+    blocks = slice_letter_blocks(full_text, "cgh")
+    applic_text = blocks["c"]
+    req_actions_text = blocks["g"]
+    exceptions_text = blocks["h"]
 
     # SB refs
     sb_refs = find_sb_refs(req_actions_text) if req_actions_text else []
@@ -449,14 +753,13 @@ def extract_details(ad_html_url: str, api_doc: Optional[Dict]):
 
     # Compliance Time
     compliance_text = None
-    m = re.search(
-        r"\(\s*[a-z]\s*\)\s*[^\n]*\bCompliance\b[^\n]*\n(.*?)(?=\n\(\s*[a-z]\s*\)\s*[^\n]*\n|\Z)",
-        full_text, flags=re.IGNORECASE | re.DOTALL
-    )
+    m = find_compliance_section(full_text)
     if m:
         compliance_text = m.group(1).strip()
     if not compliance_text:
-        m2 = re.search(r"\bCompliance\b[:.]?\s*(.+?)(?=\n{2,}|\Z)", full_text, flags=re.IGNORECASE | re.DOTALL)
+        # The fallback can only start at a "Compliance" word, so skip straight to the first one
+        first = next(_compliance_words(full_text), None)
+        m2 = COMPLIANCE_FALLBACK_RE.search(full_text, first.start()) if first else None
         if m2:
             compliance_text = m2.group(1).strip()
 
@@ -469,24 +772,116 @@ def extract_details(ad_html_url: str, api_doc: Optional[Dict]):
         "_full_html_text": full_text,
     }
 
+def extract_details(ad_html_url: str, api_doc: Optional[Dict]):
+    try:
+        return _extract_details(ad_html_url, api_doc)
+    except Exception as e:
+        return {
+            "affected_aircraft": f"Error extracting: {e}",
+            "required_actions": "N/A",
+            "exceptions": "N/A",
+            "compliance_times": "N/A",
+            "sb_references": [],
+            "_full_html_text": "",
+        }
+
+def with_script_run_ctx(fn):
+    """Bind fn to the calling script run, so executor threads can use the st.cache_* cores."""
+    ctx = get_script_run_ctx()
+
+    def run(*args, **kwargs):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args, **kwargs)
+    return run
+
+def prefetch_ads(ad_numbers: List[str], max_workers: int = 4) -> None:
+    """
+    Warm the fetch caches for several ADs concurrently so a serial loop over them reads from
+    cache. Worker threads only call the cached cores (no st.* output); failures are skipped
+    here and surface through the normal wrappers afterwards.
+    """
+    def warm(ad_no: str) -> None:
+        data = _fetch_ad_data(ad_no)
+        if data:
+            extract_details(data["html_url"], fetch_document_json(data.get("document_number")))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        warm = with_script_run_ctx(warm)
+        for future in [pool.submit(warm, ad_no) for ad_no in dict.fromkeys(ad_numbers)]:
+            try:
+                future.result()
+            except Exception:
+                pass
+
 
 # -----------------------------
 # Image helpers (logo/stamp)
 # -----------------------------
+def _remote_image_bytes(url: str) -> bytes:
+    """Download a logo/stamp image; raises on errors."""
+    resp = SESSION.get(url, timeout=10)
+    resp.raise_for_status()
+    return resp.content
+
+@st.cache_resource(ttl=86400, show_spinner=False)
+def _prepared_logo_bytes(url: str, scale: float = 0.3) -> bytes:
+    """Download the report logo, grayscale it and scale it down once a day rather than once per
+    PDF; returns PNG bytes. Only for LOGO_URL: user-supplied stamp URLs stay uncached."""
+    from PIL import Image as PILImage
+    pil_img = PILImage.open(io.BytesIO(_remote_image_bytes(url))).convert("L")
+    w, h = pil_img.size
+    pil_img = pil_img.resize((max(1, int(w * scale)), max(1, int(h * scale))), PILImage.LANCZOS)
+    logo_buf = io.BytesIO()
+    pil_img.save(logo_buf, format="PNG")
+    return logo_buf.getvalue()
+
+def prepared_logo_bytes(url: str) -> Optional[bytes]:
+    try:
+        return _prepared_logo_bytes(url)
+    except Exception:
+        return None
+
+_LOGO_RETRY_SECONDS = 300
+
+@st.cache_resource(show_spinner=False)
+def _logo_warmup() -> Dict[str, object]:
+    """Process-wide warm-up state: the in-flight task and when the last attempt failed."""
+    return {"pool": ThreadPoolExecutor(max_workers=1), "future": None, "failed_at": {}}
+
+def _warm_logo(url: str) -> None:
+    state = _logo_warmup()
+    if prepared_logo_bytes(url) is None:
+        state["failed_at"][url] = time.monotonic()
+    else:
+        state["failed_at"].pop(url, None)
+
+def warm_logo(url: str) -> None:
+    """Prepare the report logo in the background without ever waiting on it; after a failed
+    download, don't retry for _LOGO_RETRY_SECONDS so a dead logo host doesn't cost every rerun."""
+    state = _logo_warmup()
+    future = state["future"]
+    if future is not None and not future.done():
+        return
+    failed_at = state["failed_at"].get(url)
+    if failed_at is not None and time.monotonic() - failed_at < _LOGO_RETRY_SECONDS:
+        return
+    # No with_script_run_ctx() here: this pool's one thread outlives every session, and binding it
+    # would pin whichever session submitted last. _warm_logo only touches st.cache_resource.
+    state["future"] = state["pool"].submit(_warm_logo, url)
+
 def _image_flowable_fit(source_bytes: Optional[bytes] = None, path_or_url: Optional[str] = None,
                         max_w_mm: float = 60, max_h_mm: float = 60):
     """Return a ReportLab Image flowable scaled proportionally to fit within max box (aspect ratio preserved)."""
     try:
         from PIL import Image as PILImage
+        from reportlab.platypus import Image
         if source_bytes:
             pil = PILImage.open(io.BytesIO(source_bytes))
         else:
             if path_or_url is None:
                 return None
             if path_or_url.lower().startswith(("http://", "https://")):
-                resp = requests.get(path_or_url, timeout=10)
-                resp.raise_for_status()
-                pil = PILImage.open(io.BytesIO(resp.content))
+                pil = PILImage.open(io.BytesIO(_remote_image_bytes(path_or_url)))
             else:
                 pil = PILImage.open(path_or_url)
         pil = pil.convert("RGBA")
@@ -513,6 +908,7 @@ def _watermark_callbacks(watermark_text: str):
         try:
             width, height = doc.pagesize
         except Exception:
+            from reportlab.lib.pagesizes import A4
             width, height = A4
         canv.saveState()
         try:
@@ -528,6 +924,63 @@ def _watermark_callbacks(watermark_text: str):
     return _draw_watermark, _draw_watermark
 
 
+# -----------------------------
+# Shared PDF styles (built once per process)
+# -----------------------------
+@st.cache_resource(show_spinner=False)
+def _pdf_styles() -> Dict:
+    """Stylesheet and table styles shared by every PDF; cached so reruns don't rebuild them."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    from reportlab.lib import colors
+
+    sheet = getSampleStyleSheet()
+    small = ParagraphStyle("small", parent=sheet["BodyText"], fontSize=9, leading=12, textColor=colors.grey)
+    return {
+        "sheet": sheet,
+        "small": small,
+        "th": ParagraphStyle("th", parent=small, fontName="Helvetica-Bold"),
+        "brand_center_small": ParagraphStyle(
+            "brand_center_small", parent=sheet["BodyText"], alignment=1, fontSize=12, textColor=colors.black
+        ),
+        "meta_table": TableStyle([
+            ("BOX", (0,0), (-1,-1), 0.5, colors.grey),
+            ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
+            ("VALIGN", (0,0), (-1,-1), "TOP"),
+            ("BACKGROUND", (0,0), (0,-1), colors.whitesmoke),
+            ("LEFTPADDING", (0,0), (-1,-1), 4),
+            ("RIGHTPADDING", (0,0), (-1,-1), 4),
+            ("TOPPADDING", (0,0), (-1,-1), 3),
+            ("BOTTOMPADDING", (0,0), (-1,-1), 3),
+        ]),
+        # Header-row grid used by the compliance records table and the batch tally
+        "grid_table": TableStyle([
+            ("BACKGROUND", (0,0), (-1,0), colors.lightgrey),
+            ("FONTNAME", (0,0), (-1,0), "Helvetica-Bold"),
+            ("FONTSIZE",  (0,0), (-1,-1), 9),
+            ("VALIGN",    (0,0), (-1,-1), "TOP"),
+            ("LINEABOVE", (0,0), (-1,0),  0.5, colors.grey),
+            ("LINEBELOW", (0,0), (-1,-1), 0.25, colors.grey),
+            ("BOX",       (0,0), (-1,-1), 0.5, colors.grey),
+            ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
+        ]),
+        # Plain-string cells of the records table (Date..Repetitive) drawn like the "small" style
+        "records_table": TableStyle([
+            ("TEXTCOLOR", (5,1), (8,-1), small.textColor),
+            ("FONTNAME",  (5,1), (8,-1), small.fontName),
+            ("LEADING",   (5,1), (8,-1), small.leading),
+        ]),
+    }
+
+def _para_markup(text: str) -> str:
+    """Plain extracted text as Paragraph markup: escape &, <, > once and keep its line breaks."""
+    return xml_escape(text).replace("\n", "<br/>")
+
+# Relative column weights, scaled to the frame width when a PDF is built
+_RECORDS_COL_WEIGHTS = (8, 12, 14, 14, 12, 8, 6, 6, 8, 10, 10, 12)
+_TALLY_COL_WEIGHTS = (16, 28, 10, 18, 48)
+
+
 # -----------------------------
 # PDF report builder (single AD)
 # -----------------------------
@@ -546,21 +999,17 @@ def build_pdf_report(
 ) -> bytes:
     if not REPORTLAB_AVAILABLE:
         raise RuntimeError("ReportLab is not installed. Add 'reportlab' to your requirements.txt.")
-
-    # Prepare grayscale 30% logo for the report header (keeps AR via helper below if fallback)
-    logo_flowable = None
-    try:
-        from PIL import Image as PILImage
-        resp = requests.get(logo_url, timeout=10)
-        resp.raise_for_status()
-        pil_img = PILImage.open(io.BytesIO(resp.content)).convert("L")
-        w, h = pil_img.size
-        pil_img = pil_img.resize((max(1, int(w * 0.3)), max(1, int(h * 0.3))), PILImage.LANCZOS)
-        logo_buf = io.BytesIO()
-        pil_img.save(logo_buf, format="PNG")
-        logo_buf.seek(0)
-        logo_flowable = Image(logo_buf)
-    except Exception:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, Image, PageBreak
+    styles = _pdf_styles()
+
+    # Grayscale 30% logo for the report header (cached; keeps AR via helper below if fallback)
+    logo_png = prepared_logo_bytes(logo_url)
+    if logo_png:
+        logo_flowable = Image(io.BytesIO(logo_png))
+    else:
         logo_flowable = _image_flowable_fit(path_or_url=logo_url, max_w_mm=40, max_h_mm=20)
 
     buf = io.BytesIO()
@@ -575,15 +1024,12 @@ def build_pdf_report(
         author="Feras Aviation AD Compliance Checker",
     )
 
-    styles = getSampleStyleSheet()
-    h1 = styles["Heading1"]
-    h2 = styles["Heading2"]
-    h3 = styles["Heading3"]
-    normal = styles["BodyText"]
-    small = ParagraphStyle("small", parent=normal, fontSize=9, leading=12, textColor=colors.grey)
-    brand_center_small = ParagraphStyle(
-        "brand_center_small", parent=normal, alignment=1, fontSize=12, textColor=colors.black
-    )
+    h1 = styles["sheet"]["Heading1"]
+    h2 = styles["sheet"]["Heading2"]
+    h3 = styles["sheet"]["Heading3"]
+    normal = styles["sheet"]["BodyText"]
+    small = styles["small"]
+    brand_center_small = styles["brand_center_small"]
 
     story = []
 
@@ -596,7 +1042,7 @@ def build_pdf_report(
 
     story.append(Paragraph("AD Compliance Report", h1))
     story.append(Spacer(1, 6))
-    generated_ts = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
+    generated_ts = time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime())
     story.append(Paragraph(f"Generated: {generated_ts}", small))
     story.append(Spacer(1, 12))
 
@@ -612,23 +1058,14 @@ def build_pdf_report(
         ["Aircraft", aircraft or ""],
     ]
     meta_table = Table(meta_data, colWidths=[40*mm, 120*mm], hAlign="LEFT")
-    meta_table.setStyle(TableStyle([
-        ("BOX", (0,0), (-1,-1), 0.5, colors.grey),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-        ("VALIGN", (0,0), (-1,-1), "TOP"),
-        ("BACKGROUND", (0,0), (0,-1), colors.whitesmoke),
-        ("LEFTPADDING", (0,0), (-1,-1), 4),
-        ("RIGHTPADDING", (0,0), (-1,-1), 4),
-        ("TOPPADDING", (0,0), (-1,-1), 3),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 3),
-    ]))
+    meta_table.setStyle(styles["meta_table"])
     story.append(meta_table)
     story.append(Spacer(1, 12))
 
     story.append(Paragraph("Extracted Details", h2))
 
     story.append(Paragraph("Applicability / Affected Aircraft", h3))
-    text = (details.get("affected_aircraft") or "").replace("\n", "<br/>") or "N/A"
+    text = _para_markup(details.get("affected_aircraft") or "") or "N/A"
     story.append(Paragraph(text, normal))
     story.append(Spacer(1, 8))
 
@@ -647,7 +1084,7 @@ def build_pdf_report(
 
     if bullets_g:
         for i, b in enumerate(bullets_g, 1):
-            story.append(Paragraph(f"{i}. {b}", normal))
+            story.append(Paragraph(f"{i}. {xml_escape(b)}", normal))
     else:
         story.append(Paragraph("Required Actions: N/A", normal))
 
@@ -655,7 +1092,7 @@ def build_pdf_report(
 
     if bullets_h:
         for i, b in enumerate(bullets_h, 1):
-            story.append(Paragraph(f"{i}. {b}", normal))
+            story.append(Paragraph(f"{i}. {xml_escape(b)}", normal))
     else:
         story.append(Paragraph("Exceptions: N/A", normal))
 
@@ -667,15 +1104,15 @@ def build_pdf_report(
     ex_text = (details.get("exceptions") or "").strip()
     parts = []
     if ra_text and ra_text.upper() != "N/A":
-        parts.append(f"<b>(g) Required Actions</b><br/>{ra_text.replace('\n','<br/>')}")
+        parts.append(f"<b>(g) Required Actions</b><br/>{_para_markup(ra_text)}")
     if ex_text and ex_text.upper() != "N/A":
-        parts.append(f"<br/><b>(h) Exceptions to Service Information Specifications</b><br/>{ex_text.replace('\n','<br/>')}")
+        parts.append(f"<br/><b>(h) Exceptions to Service Information Specifications</b><br/>{_para_markup(ex_text)}")
     combined = "<br/><br/>".join(parts) if parts else "N/A"
     story.append(Paragraph(combined, normal))
     story.append(Spacer(1, 8))
 
     story.append(Paragraph("Compliance Deadlines", h3))
-    ct_text = (details.get("compliance_times") or "").replace("\n", "<br/>") or "N/A"
+    ct_text = _para_markup(details.get("compliance_times") or "") or "N/A"
     story.append(Paragraph(ct_text, normal))
     story.append(Spacer(1, 8))
 
@@ -691,55 +1128,55 @@ def build_pdf_report(
             "Date", "Hours", "Cycles", "Repetitive", "Interval", "Basis", "Next Due"
         ]
 
-        from xml.sax.saxutils import escape as xml_escape
+        parsed = {}
         def P(text):
-            return Paragraph(xml_escape(str(text)) if text is not None else "", small)
-
-        rows = [[Paragraph(label, ParagraphStyle("th", parent=small, fontName="Helvetica-Bold")) for label in header]]
-
-        for rec in records_list:
-            next_due = rec.get("next_due") or {}
-            if isinstance(next_due, dict):
-                nd_parts = []
-                if next_due.get("hours") is not None:  nd_parts.append(f"H:{next_due['hours']}")
-                if next_due.get("cycles") is not None: nd_parts.append(f"C:{next_due['cycles']}")
-                if next_due.get("calendar"):            nd_parts.append(next_due["calendar"])
-                nd_text = ", ".join(nd_parts)
-            else:
-                nd_text = str(next_due)
+            # Markup parsing dominates Paragraph cost and cell values repeat a lot (Yes/No,
+            # blanks, statuses): parse each distinct value once, give every cell its own copy.
+            markup = xml_escape(str(text)) if text is not None else ""
+            para = parsed.get(markup)
+            if para is None:
+                para = parsed[markup] = Paragraph(markup, small)
+            return copy.copy(para)
 
-            rows.append([
+        avail = doc.width
+        total = sum(_RECORDS_COL_WEIGHTS)
+        col_widths = [avail * w / total for w in _RECORDS_COL_WEIGHTS]
+        # Paragraph splits words wider than the cell; plain strings don't, so only use them there
+        cell_padding = 12  # default LEFTPADDING + RIGHTPADDING
+
+        def C(value, col):
+            # Short single-token values (hours, cycles, Yes/No) are drawn as plain strings in the
+            # Paragraph look (records_table style), which skips building a Paragraph per cell
+            text = "" if value is None else str(value)
+            if (" " not in text and text.isprintable()
+                    and stringWidth(text, small.fontName, small.fontSize) <= col_widths[col] - cell_padding):
+                return text
+            return P(text)
+
+        method_join = "; ".join
+        def record_cells(rec):
+            is_rep = bool(rec.get("repetitive"))
+            return [
                 P(rec.get("status", "")),
-                P("; ".join(rec.get("method", []) or [])),
+                P(method_join(rec.get("method", []) or [])),
                 P(rec.get("method_other", "")),
                 P(rec.get("applic_aircraft", "")),
                 P(rec.get("applic_serials", "")),
-                P(rec.get("performed_date", "")),
-                P(rec.get("performed_hours", "")),
-                P(rec.get("performed_cycles", "")),
-                P("Yes" if rec.get("repetitive") else "No"),
-                P((f"{rec.get('rep_interval_value','')} {rec.get('rep_interval_unit','')}".strip()
-                   if rec.get("repetitive") else "")),
-                P((rec.get('rep_basis','') if rec.get('repetitive') else "")),
-                P(nd_text),
-            ])
-
-        weights = [8, 12, 14, 14, 12, 8, 6, 6, 8, 10, 10, 12]
-        total = sum(weights)
-        avail = doc.width
-        col_widths = [avail * w / total for w in weights]
-
-        table = Table(rows, colWidths=col_widths, repeatRows=1, hAlign="LEFT")
-        table.setStyle(TableStyle([
-            ("BACKGROUND", (0,0), (-1,0), colors.lightgrey),
-            ("FONTNAME", (0,0), (-1,0), "Helvetica-Bold"),
-            ("FONTSIZE",  (0,0), (-1,-1), 9),
-            ("VALIGN",    (0,0), (-1,-1), "TOP"),
-            ("LINEABOVE", (0,0), (-1,0),  0.5, colors.grey),
-            ("LINEBELOW", (0,0), (-1,-1), 0.25, colors.grey),
-            ("BOX",       (0,0), (-1,-1), 0.5, colors.grey),
-            ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-        ]))
+                C(rec.get("performed_date", ""), 5),
+                C(rec.get("performed_hours", ""), 6),
+                C(rec.get("performed_cycles", ""), 7),
+                C("Yes" if is_rep else "No", 8),
+                P(f"{rec.get('rep_interval_value','')} {rec.get('rep_interval_unit','')}".strip() if is_rep else ""),
+                P(rec.get("rep_basis", "") if is_rep else ""),
+                P(format_next_due(rec.get("next_due"))),
+            ]
+
+        rows = [[Paragraph(label, styles["th"]) for label in header]] + [record_cells(rec) for rec in records_list]
+
+        # LongTable only measures the rows that fit the current frame when splitting across pages
+        table = LongTable(rows, colWidths=col_widths, repeatRows=1, splitByRow=1, hAlign="LEFT")
+        table.setStyle(styles["grid_table"])
+        table.setStyle(styles["records_table"])
         story.append(table)
 
     # Footer note
@@ -784,6 +1221,10 @@ def build_tally_pdf(
     """
     if not REPORTLAB_AVAILABLE:
         raise RuntimeError("ReportLab is not installed. Add 'reportlab' to your requirements.txt.")
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+    styles = _pdf_styles()
 
     buf = io.BytesIO()
     doc = SimpleDocTemplate(
@@ -797,11 +1238,9 @@ def build_tally_pdf(
         author="Feras Aviation Technical Services Ltd. AD Compliance Checker",
     )
 
-    styles = getSampleStyleSheet()
-    h1 = styles["Heading1"]
-    h2 = styles["Heading2"]
-    normal = styles["BodyText"]
-    small = ParagraphStyle("small", parent=normal, fontSize=9, leading=12, textColor=colors.grey)
+    h1 = styles["sheet"]["Heading1"]
+    h2 = styles["sheet"]["Heading2"]
+    small = styles["small"]
 
     story = []
 
@@ -813,13 +1252,13 @@ def build_tally_pdf(
     story.append(Spacer(1, 8))
 
     story.append(Paragraph("Batch AD Tally", h1))
-    generated_ts = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
+    generated_ts = time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime())
     story.append(Paragraph(f"Generated: {generated_ts}", small))
     story.append(Spacer(1, 12))
 
     # Table header
     header = ["AD Number", "Document Number", "ATA", "Effective Date", "Title"]
-    data = [[Paragraph(h, ParagraphStyle("th", parent=small, fontName="Helvetica-Bold")) for h in header]]
+    data = [[Paragraph(h, styles["th"]) for h in header]]
 
     for r in rows:
         eff = r.get("effective_date") or "N/A"
@@ -834,21 +1273,11 @@ def build_tally_pdf(
 
     # adaptive column widths
     avail_width = doc.width
-    weights = [16, 28, 10, 18, 48]  # relative weights
-    total_w = sum(weights)
-    col_widths = [avail_width * w / total_w for w in weights]
+    total_w = sum(_TALLY_COL_WEIGHTS)
+    col_widths = [avail_width * w / total_w for w in _TALLY_COL_WEIGHTS]
 
     table = Table(data, colWidths=col_widths, repeatRows=1, hAlign="LEFT")
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,0), colors.lightgrey),
-        ("FONTNAME", (0,0), (-1,0), "Helvetica-Bold"),
-        ("FONTSIZE",  (0,0), (-1,-1), 9),
-        ("VALIGN",    (0,0), (-1,-1), "TOP"),
-        ("LINEABOVE", (0,0), (-1,0),  0.5, colors.grey),
-        ("LINEBELOW", (0,0), (-1,-1), 0.25, colors.grey),
-        ("BOX",       (0,0), (-1,-1), 0.5, colors.grey),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-    ]))
+    table.setStyle(styles["grid_table"])
     story.append(table)
 
     story.append(Spacer(1, 18))
@@ -863,7 +1292,7 @@ def build_tally_pdf(
     )
     if stamp_flowable:
         story.append(Spacer(1, 12))
-        story.append(Paragraph("Approval Stamp", styles["Heading3"]))
+        story.append(Paragraph("Approval Stamp", styles["sheet"]["Heading3"]))
         story.append(Spacer(1, 8))
         story.append(stamp_flowable)
 
@@ -904,11 +1333,12 @@ def _coerce_bool_from_yn(val) -> bool:
     s = _coerce_str(val).strip().lower()
     return s in {"y", "yes", "true", "1"}
 
+METHOD_SPLIT_RE = re.compile(r"[;,/]")
 def _parse_methods(val) -> List[str]:
     s = _coerce_str(val)
     if not s:
         return []
-    parts = [p.strip() for p in re.split(r"[;,/]", s) if p.strip()]
+    parts = [p.strip() for p in METHOD_SPLIT_RE.split(s) if p.strip()]
     return parts
 
 def build_records_for_ad(ad_no: str, df_records: pd.DataFrame) -> List[Dict]:
@@ -972,12 +1402,67 @@ def build_records_for_ad(ad_no: str, df_records: pd.DataFrame) -> List[Dict]:
     return records
 
 
+# -----------------------------
+# Compliance records: display + CSV export
+# -----------------------------
+def format_next_due(next_due) -> str:
+    if not next_due:
+        return ""
+    if not isinstance(next_due, dict):
+        return str(next_due)
+    nd_parts = []
+    if next_due.get("hours") is not None:  nd_parts.append(f"H:{next_due['hours']}")
+    if next_due.get("cycles") is not None: nd_parts.append(f"C:{next_due['cycles']}")
+    if next_due.get("calendar"):            nd_parts.append(next_due["calendar"])
+    return ", ".join(nd_parts)
+
+def record_display_rows(records: List[Dict]) -> List[Dict]:
+    """Flatten records (list/dict fields to text) with a leading Entry number for st.dataframe."""
+    return [
+        {
+            "Entry": idx,
+            **rec,
+            "method": "; ".join(rec.get("method") or []),
+            "next_due": format_next_due(rec.get("next_due")),
+        }
+        for idx, rec in enumerate(records, start=1)
+    ]
+
+COMPLIANCE_CSV_COLUMNS = [
+    "ad_number","document_number","status","method","method_other","applic_aircraft",
+    "applic_serials","performed_date","performed_hours","performed_cycles",
+    "repetitive","rep_interval_value","rep_interval_unit","rep_basis","next_due"
+]
+
+def _compliance_csv_row(rec: Dict) -> Dict:
+    """Flatten one record for the CSV; shared by both writers so their output can't drift."""
+    return {
+        **rec,
+        "method": "; ".join(rec.get("method") or []),
+        "next_due": json.dumps(rec.get("next_due")),
+    }
+
+def compliance_csv_bytes(records: List[Dict]) -> bytes:
+    rows = [_compliance_csv_row(rec) for rec in records]
+    if PANDAS_AVAILABLE:
+        # One DataFrame + pandas' C writer; object dtype keeps ints as ints next to None
+        df = pd.DataFrame(rows, columns=COMPLIANCE_CSV_COLUMNS, dtype=object)
+        return df.to_csv(index=False, lineterminator="\r\n").encode("utf-8")
+
+    buf_csv = io.StringIO()
+    writer = csv.DictWriter(buf_csv, fieldnames=COMPLIANCE_CSV_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf_csv.getvalue().encode("utf-8")
+
+
 # -----------------------------
 # Main flow (single AD)
 # -----------------------------
 if ad_number:
     with st.spinner("🔍 Searching Federal Register..."):
         data = fetch_ad_data(ad_number)
+    records = st.session_state["compliance_records"]
 
     if data:
         data["ad_number"] = ad_number
@@ -995,10 +1480,18 @@ if ad_number:
         st.markdown(f"[🔗 View Full AD (HTML)]({data['html_url']})")
         st.markdown(f"[📄 View PDF]({data['pdf_url']})")
 
-        api_doc = fetch_document_json(data.get("document_number"))
+        # The report logo and the AD body text don't depend on the document JSON: fetch them in
+        # the background while it loads. extract_details() then reads the body from the cache
+        # (or waits on the in-flight fetch for it); a failed prefetch just falls through to it.
+        # The logo is only needed for the PDF, so that warm-up is never waited on.
+        warm_logo(LOGO_URL)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            if data.get("body_html_url"):
+                pool.submit(with_script_run_ctx(_fetch_text), data["body_html_url"])
+            api_doc = fetch_document_json(data.get("document_number"))
 
-        with st.spinner("📄 Extracting AD details..."):
-            details = extract_details(data['html_url'], api_doc)
+            with st.spinner("📄 Extracting AD details..."):
+                details = extract_details(data['html_url'], api_doc)
 
         detected_ata = detect_ata_from_subject(details.get("_full_html_text",""))
         if not detected_ata:
@@ -1140,43 +1633,21 @@ if ad_number:
                     next_due["calendar"] = f"+{record['rep_interval_value']} {record['rep_interval_unit']} ({rep_basis})"
             record["next_due"] = next_due or None
 
-            st.session_state["compliance_records"].append(record)
+            records.append(record)
             st.success("Compliance entry added.")
 
-        if st.session_state["compliance_records"]:
+        if records:
             st.subheader("🗂️ Recorded Compliance Entries")
-            for idx, rec in enumerate(st.session_state["compliance_records"], start=1):
-                st.markdown(f"**Entry {idx}** — Status: {rec['status']}")
-                st.json({k: v for k, v in rec.items()})
-
-            buf_csv = io.StringIO()
-            writer = csv.writer(buf_csv)
-            writer.writerow([
-                "ad_number","document_number","status","method","method_other","applic_aircraft",
-                "applic_serials","performed_date","performed_hours","performed_cycles",
-                "repetitive","rep_interval_value","rep_interval_unit","rep_basis","next_due"
-            ])
-            for rec in st.session_state["compliance_records"]:
-                writer.writerow([
-                    rec.get("ad_number"),
-                    rec.get("document_number"),
-                    rec.get("status"),
-                    "; ".join(rec.get("method", []) or []),
-                    rec.get("method_other"),
-                    rec.get("applic_aircraft"),
-                    rec.get("applic_serials"),
-                    rec.get("performed_date"),
-                    rec.get("performed_hours"),
-                    rec.get("performed_cycles"),
-                    rec.get("repetitive"),
-                    rec.get("rep_interval_value"),
-                    rec.get("rep_interval_unit"),
-                    rec.get("rep_basis"),
-                    json.dumps(rec.get("next_due")),
-                ])
+            # One Arrow-serialized table instead of a markdown + st.json pair per entry
+            st.dataframe(
+                record_display_rows(records),
+                hide_index=True,
+            )
+
             st.download_button(
                 "Download Compliance CSV",
-                data=buf_csv.getvalue().encode("utf-8"),
+                # Deferred: the CSV is built when the button is clicked, not on every rerun
+                data=lambda: compliance_csv_bytes(records),
                 file_name=f"compliance_{data['document_number']}.csv",
                 mime="text/csv",
             )
@@ -1190,15 +1661,15 @@ if ad_number:
             if st.button("Generate PDF"):
                 try:
                     aircraft_for_report = ""
-                    if st.session_state["compliance_records"]:
-                        aircraft_for_report = st.session_state["compliance_records"][-1].get("applic_serials", "") or ""
+                    if records:
+                        aircraft_for_report = records[-1].get("applic_serials", "") or ""
 
                     stamp_bytes_data = stamp_file.read() if stamp_file is not None else None
 
                     pdf_bytes = build_pdf_report(
                         ad_data=data,
                         details=details,
-                        records=st.session_state["compliance_records"],
+                        records=records,
                         logo_url=LOGO_URL,
                         site_url=SITE_URL,
                         customer=customer_for_report,
@@ -1277,6 +1748,12 @@ if xlsx is not None and PANDAS_AVAILABLE and PYPDF2_AVAILABLE and REPORTLAB_AVAI
                     tally_stamp_bytes = stamp_file.read() if stamp_file is not None else None
                     tally_stamp_url = stamp_path_or_url if tally_stamp_bytes is None else None
 
+                    # The per-AD lookups are independent network round-trips: run them concurrently
+                    # up front, then the loop below (and its messages) works from the caches.
+                    batch_ad_numbers = [a for a in (str(v).strip() for v in df_main[ad_col]) if a and a.lower() != "nan"]
+                    with st.spinner(f"🔍 Fetching {len(batch_ad_numbers)} ADs..."):
+                        prefetch_ads(batch_ad_numbers)
+
                     for idx, row in df_main.iterrows():
                         ad_no = str(row[ad_col]).strip()
                         if not ad_no or ad_no.lower() == "nan":
@@ -0,0 +1,23 @@
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="session")
+def ad_checker(tmp_path_factory):
+    """
+    Import the Streamlit script (it runs in bare mode: no input, no fetches) from a scratch
+    working directory, so the on-disk HTTP cache it opens lands there and not in the checkout.
+    """
+    sys.path.insert(0, str(REPO_ROOT))
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("ad_checker"))
+    try:
+        return importlib.import_module("ad_checker")
+    finally:
+        os.chdir(cwd)
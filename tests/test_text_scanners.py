@@ -0,0 +1,175 @@
+"""
+The letter-block slicer, the Compliance-section search and the SB-code scan replaced plain
+regex searches on the extraction path. Each is checked here against the regex it replaced.
+"""
+import random
+import re
+
+import pytest
+
+
+# -----------------------------
+# Baseline implementations
+# -----------------------------
+BASELINE_LETTER_BLOCK_RE_TEMPLATE = r"""
+    \(\s*{letter}\s*\)       # (c), (d), (g), (h)...
+    [^\n]*?                  # header line
+    \n?                      # optional newline
+    (                        # capture the body
+        .*?
+    )
+    (?=                      # stop at next lettered section or end
+        \n\(\s*[a-z]\s*\)\s*[^\n]*\n
+        | \Z
+    )
+"""
+BASELINE_COMPLIANCE_RE = re.compile(
+    r"\(\s*[a-z]\s*\)\s*[^\n]*\bCompliance\b[^\n]*\n(.*?)(?=\n\(\s*[a-z]\s*\)\s*[^\n]*\n|\Z)",
+    re.IGNORECASE | re.DOTALL
+)
+BASELINE_SB_CODE_RE = re.compile(r"\b[A-Z0-9]+(?:-[A-Z0-9]+)*-SB[0-9A-Z]+(?:-[0-9A-Z]+)*\b", re.IGNORECASE)
+
+def baseline_slice_letter_block(full_text, letter):
+    if not full_text:
+        return None
+    t = full_text.replace("\u00a0", " ")
+    t = re.sub(r"\r\n?", "\n", t)
+    t = re.sub(r"(?<!\n)\(\s*([a-z])\s*\)", r"\n(\1)", t, flags=re.IGNORECASE)
+    pat = BASELINE_LETTER_BLOCK_RE_TEMPLATE.format(letter=re.escape(letter))
+    m = re.compile(pat, re.IGNORECASE | re.DOTALL | re.VERBOSE).search(t)
+    if m:
+        body = m.group(1).strip()
+        body = re.sub(r"\n{3,}", "\n\n", body)
+        return body if body else None
+    return None
+
+def match_key(m):
+    return None if m is None else (m.span(), m.groups(), m.group(0))
+
+
+# -----------------------------
+# Representative AD text
+# -----------------------------
+AD_TEXT = """Airworthiness Directives; Airbus SAS Airplanes
+(a) Effective Date
+This airworthiness directive (AD) is effective February 5, 2025.
+(b) Affected ADs
+None.
+(c) Applicability
+This AD applies to Airbus SAS Model A320-214 airplanes, certificated in any category, as identified in
+Airbus Service Bulletin A320-SB57-1234, Revision 01, dated March 3, 2024.
+(d) Subject
+Air Transport Association (ATA) of America Code 57, Wings.
+(e) Unsafe Condition
+This AD was prompted by reports of cracking. The FAA is issuing this AD to address cracking.
+(f) Compliance
+Comply with this AD within the compliance times specified, unless already done.
+(g) Required Actions
+Except as specified in paragraph (h) of this AD: At the applicable times specified in paragraph 1.E.,
+"Compliance," of A320-SB57-1234-01 and a320-sb57-1235, do all applicable actions, including
+the actions in paragraph (g)(1) and (g)(2) of this AD.
+(1) Inspect the wing rib.
+
+
+(2) Repair any crack in accordance with EMB145-SB32-0123-01.
+(h) Exceptions to Service Information Specifications
+(1) Where the service information specified in paragraph (g) of this AD refers to its effective date,
+this AD requires using the effective date of this AD.
+(2) Where ATR72-SB2401-05 specifies contacting the manufacturer, this AD requires repair using a method
+approved by the Manager, International Validation Branch, FAA.
+(i) Additional AD Provisions
+Alternative Methods of Compliance (AMOCs): The Manager has the authority to approve AMOCs.
+(j) Related Information
+For more information about this AD, contact the FAA.
+"""
+
+SLICE_TEXTS = [
+    AD_TEXT,
+    AD_TEXT.replace("\n", "\r\n"),
+    AD_TEXT.replace(" ", "\u00a0", 40),
+    # (g) and (h) run inline, as flattened HTML sometimes leaves them
+    "(f) Compliance\nComply. (g) Required Actions Do the inspection in (g)(1). (h) Exceptions None.\n",
+    "( G )  Required Actions\nInspect.\n(H)\nExceptions\nNone",
+    # (g) with no (h) after it, and (h) before (g)
+    "(g) Required Actions\nInspect the rib.\n\n\n\nThen repair it.",
+    "(h) Exceptions\nNone.\n(g) Required Actions\nInspect.\n",
+    # The first marker of a letter wins, even when it is an inline reference
+    "See paragraph (h) of this AD.\n(g) Required Actions\nInspect.\n(h) Exceptions\nNone.\n",
+    # Header with no body, markers only, and a boundary without a trailing newline
+    "(g) Required Actions\n(h) Exceptions\n",
+    "(g)(h)(g)",
+    "(g) Required Actions\nInspect.\n(h) Exceptions",
+    # No-match inputs
+    "",
+    "No lettered paragraphs at all.",
+    "(1) Numbered only\n(2) Still numbered\n",
+]
+
+COMPLIANCE_TEXTS = [
+    AD_TEXT,
+    AD_TEXT.replace("(f) Compliance", "(f) COMPLIANCE"),
+    "(e) Unsafe Condition\nCracking; see (a) and (b).\n(f)\n   Compliance\nComply within 30 days.\n(g) Actions\nx\n",
+    "(f) Compliance: comply with this AD.\n",
+    # Inline references and an in-body "Compliance" ahead of the real header
+    "(a) Refer to paragraph (g)(1), \"Compliance,\" of the SB.\n(b) Other\n(f) Compliance\nBody.\n",
+    # The header needs a trailing newline; word boundaries must hold
+    "(f) Compliance",
+    "(f) Noncompliance\nBody.\n(g) Compliances\nMore.\n",
+    "(f) Compliance été\nCorps du texte.\n(g) Suite\n",
+    "",
+    "Compliance\nNo lettered header anywhere.\n",
+]
+
+SB_TEXTS = [
+    AD_TEXT,
+    AD_TEXT.lower(),
+    "A320-SB57-1234 and A320-SB57-1234 again, then B-SB1-X-SB2-Y, _A-SB1 and A-SB1_.",
+    "-SB57 alone, A-SB, A--SB1, A-SBX-, 12-sb34-56-.",
+    "Non-ASCII: éA320-SB57-1234, A320-ſB57 and A320-SB57-é1.",
+    "No service bulletins here.",
+    "",
+]
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+@pytest.mark.parametrize("text", SLICE_TEXTS)
+def test_slice_letter_blocks_matches_baseline(ad_checker, text):
+    blocks = ad_checker.slice_letter_blocks(text, "abcfghz")
+    assert blocks == {letter: baseline_slice_letter_block(text, letter) for letter in "abcfghz"}
+    for letter in "cgh":
+        assert ad_checker.slice_letter_block(text, letter) == baseline_slice_letter_block(text, letter)
+
+@pytest.mark.parametrize("text", COMPLIANCE_TEXTS)
+def test_find_compliance_section_matches_baseline(ad_checker, text):
+    assert match_key(ad_checker.find_compliance_section(text)) == match_key(BASELINE_COMPLIANCE_RE.search(text))
+
+@pytest.mark.parametrize("text", SB_TEXTS)
+def test_sb_code_matches_match_baseline(ad_checker, text):
+    got = [match_key(m) for m in ad_checker._sb_code_matches(text)]
+    assert got == [match_key(m) for m in BASELINE_SB_CODE_RE.finditer(text)]
+
+def test_representative_ad_sections(ad_checker):
+    blocks = ad_checker.slice_letter_blocks(AD_TEXT, "cgh")
+    assert blocks["c"].startswith("Applicability\nThis AD applies to Airbus SAS Model A320-214")
+    assert blocks["h"] is not None
+    assert ad_checker.find_compliance_section(AD_TEXT).group(1).startswith("Comply with this AD")
+    assert ad_checker.find_sb_refs(AD_TEXT) == [
+        "A320-SB57-1234", "A320-SB57-1234-01", "A320-SB57-1235", "EMB145-SB32-0123-01", "ATR72-SB2401-05",
+    ]
+
+def test_randomized_inputs_match_baseline(ad_checker):
+    tokens = ["(a)", "(c)", "( g )", "(G)", "(h)", "(1)", "(ab)", "(", "\n", "\n\n\n", "\r\n", "\r", "\u00a0",
+              " ", "x", "Required Actions", "Compliance", "compliance", "Non", ":", "A320", "-SB57", "-sb",
+              "-1234", "_", "é"]
+    rng = random.Random(1234)
+    for _ in range(3000):
+        text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 30)))
+        assert ad_checker.slice_letter_blocks(text, "cgh") == {
+            letter: baseline_slice_letter_block(text, letter) for letter in "cgh"
+        }, text
+        assert match_key(ad_checker.find_compliance_section(text)) == match_key(BASELINE_COMPLIANCE_RE.search(text)), text
+        assert [match_key(m) for m in ad_checker._sb_code_matches(text)] == [
+            match_key(m) for m in BASELINE_SB_CODE_RE.finditer(text)
+        ], text